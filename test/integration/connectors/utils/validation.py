@@ -1,11 +1,11 @@
 import filecmp
-import json
 import os
 import shutil
 from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Callable, Optional
 
+import orjson
 import pandas as pd
 from deepdiff import DeepDiff
 
@@ -13,6 +13,10 @@ from test.integration.connectors.utils.constants import expected_results_path
 from unstructured_ingest.v2.interfaces import Downloader, FileData, Indexer
 
 
+def canonical_json(data: dict) -> bytes:
+    return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
 def pandas_df_equality_check(expected_filepath: Path, current_filepath: Path) -> bool:
     expected_df = pd.read_csv(expected_filepath)
     current_df = pd.read_csv(current_filepath)
@@ -40,11 +44,16 @@ class ValidationConfigs:
     exclude_fields_extend: list[str] = field(default_factory=list)
     validate_downloaded_files: bool = False
     downloaded_file_equality_check: Optional[Callable[[Path, Path], bool]] = None
+    _exclude_paths: list[tuple[str, ...]] = field(init=False, repr=False)
+
+    def __post_init__(self):
+        # Split the dotted field paths once rather than for every file being checked
+        self._exclude_paths = [
+            tuple(exclude_field.split(".")) for exclude_field in self.get_exclude_fields()
+        ]
 
     def get_exclude_fields(self) -> list[str]:
-        exclude_fields = self.exclude_fields
-        exclude_fields.extend(self.exclude_fields_extend)
-        return exclude_fields
+        return [*self.exclude_fields, *self.exclude_fields_extend]
 
     def run_file_data_validation(
         self, predownload_file_data: FileData, postdownload_file_data: FileData
@@ -63,31 +72,29 @@ class ValidationConfigs:
         return expected_results_path / self.test_id
 
     def omit_ignored_fields(self, data: dict) -> dict:
-        exclude_fields = self.get_exclude_fields()
-        # Ignore fields that dynamically change every time the tests run
-        copied_data = data.copy()
-        for exclude_field in exclude_fields:
-            exclude_field_vals = exclude_field.split(".")
-            if len(exclude_field_vals) == 1:
-                current_val = copied_data
-                drop_field = exclude_field_vals[0]
-                copied_data.pop(exclude_field_vals[0], None)
-            else:
-                current_val = copied_data
-                for val in exclude_field_vals[:-1]:
-                    current_val = current_val.get(val, {})
-                drop_field = exclude_field_vals[-1]
-            if drop_field == "*":
-                current_val.clear()
+        # Ignore fields that dynamically change every time the tests run. Work on a deep copy
+        # (a JSON round trip is cheaper than copy.deepcopy) so nested dicts of the caller's
+        # data are left untouched.
+        copied_data = orjson.loads(canonical_json(data))
+        for exclude_path in self._exclude_paths:
+            current_val = copied_data
+            for val in exclude_path[:-1]:
+                current_val = current_val.get(val)
+                if not isinstance(current_val, dict):
+                    break
             else:
-                current_val.pop(drop_field, None)
+                drop_field = exclude_path[-1]
+                if drop_field == "*":
+                    current_val.clear()
+                else:
+                    current_val.pop(drop_field, None)
         return copied_data
 
 
 def get_files(dir_path: Path) -> list[str]:
-    return [
-        str(f).replace(str(dir_path), "").lstrip("/") for f in dir_path.iterdir() if f.is_file()
-    ]
+    # DirEntry.is_file() can answer from the directory listing without a stat per entry
+    with os.scandir(dir_path) as entries:
+        return [entry.name for entry in entries if entry.is_file()]
 
 
 def check_files(expected_output_dir: Path, all_file_data: list[FileData]):
@@ -110,15 +117,19 @@ def check_contents(
     found_diff = False
     for file_data in all_file_data:
         file_data_path = expected_output_dir / f"{file_data.identifier}.json"
-        with file_data_path.open("r") as file:
-            expected_file_data_contents = json.load(file)
+        expected_file_data_contents = orjson.loads(file_data_path.read_bytes())
         current_file_data_contents = file_data.to_dict()
         expected_file_data_contents = configs.omit_ignored_fields(expected_file_data_contents)
         current_file_data_contents = configs.omit_ignored_fields(current_file_data_contents)
+        # Comparing canonical serializations is much cheaper than running DeepDiff, which is
+        # only needed to report what differs
+        if canonical_json(expected_file_data_contents) == canonical_json(
+            current_file_data_contents
+        ):
+            continue
+        found_diff = True
         diff = DeepDiff(expected_file_data_contents, current_file_data_contents)
-        if diff:
-            found_diff = True
-            print(diff.to_json(indent=2))
+        print(diff.to_json(indent=2))
     assert not found_diff, f"Diffs found between files: {found_diff}"
 
 
@@ -174,8 +185,7 @@ def run_expected_download_files_validation(
 
 def run_directory_structure_validation(expected_output_dir: Path, download_files: list[str]):
     directory_record = expected_output_dir / "directory_structure.json"
-    with directory_record.open("r") as directory_file:
-        directory_file_contents = json.load(directory_file)
+    directory_file_contents = orjson.loads(directory_record.read_bytes())
     directory_structure = directory_file_contents["directory_structure"]
     assert directory_structure == download_files
 
@@ -194,15 +204,15 @@ def update_fixtures(
     file_data_output_path.mkdir(parents=True, exist_ok=True)
     for file_data in all_file_data:
         file_data_path = file_data_output_path / f"{file_data.identifier}.json"
-        with file_data_path.open(mode="w") as f:
-            json.dump(file_data.to_dict(), f, indent=2)
+        file_data_path.write_bytes(orjson.dumps(file_data.to_dict(), option=orjson.OPT_INDENT_2))
 
     # Record file structure of download directory
     download_files = get_files(dir_path=download_dir)
     download_files.sort()
     download_dir_record = output_dir / "directory_structure.json"
-    with download_dir_record.open(mode="w") as f:
-        json.dump({"directory_structure": download_files}, f, indent=2)
+    download_dir_record.write_bytes(
+        orjson.dumps({"directory_structure": download_files}, option=orjson.OPT_INDENT_2)
+    )
 
     # If applicable, save raw downloads
     if save_downloads:
@@ -0,0 +1,92 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from unstructured_ingest.connector.confluence import (
+    ConfluenceDocumentMeta,
+    ConfluenceIngestDoc,
+    _get_cached_client,
+    scroll_wrapper,
+)
+from unstructured_ingest.interfaces import ProcessorConfig, ReadConfig
+
+
+def test_update_source_metadata_reuses_fetched_page(mocker):
+    """A page passed in by get_file should not trigger a second fetch."""
+    get_page = mocker.patch(
+        "unstructured_ingest.connector.confluence.ConfluenceIngestDoc._get_page",
+    )
+    ingest_doc = ConfluenceIngestDoc(
+        connector_config=MagicMock(),
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+        document_meta=ConfluenceDocumentMeta(space_id="space", document_id="1"),
+    )
+    page = {
+        "history": {"createdDate": "2023-06-16T05:05:05.000Z"},
+        "version": {"number": 2},
+        "_links": {"self": "https://example.atlassian.net/wiki/rest/api/content/1"},
+    }
+
+    ingest_doc.update_source_metadata(page=page)
+
+    get_page.assert_not_called()
+    assert ingest_doc.source_metadata.exists
+    assert ingest_doc.source_metadata.date_modified == "2023-06-16T05:05:05"
+    assert ingest_doc.source_metadata.version == 2
+
+
+def test_update_source_metadata_missing_page(mocker):
+    mocker.patch(
+        "unstructured_ingest.connector.confluence.ConfluenceIngestDoc._get_page",
+        return_value=None,
+    )
+    ingest_doc = ConfluenceIngestDoc(
+        connector_config=MagicMock(),
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+        document_meta=ConfluenceDocumentMeta(space_id="space", document_id="1"),
+    )
+
+    ingest_doc.update_source_metadata()
+
+    assert not ingest_doc.source_metadata.exists
+
+
+def test_scroll_wrapper_requests_each_page_once():
+    func = MagicMock(
+        side_effect=[{"results": list(range(100))}, {"results": list(range(20))}, {"results": []}]
+    )
+
+    results = scroll_wrapper(func)(number_of_items_to_fetch=500)
+
+    assert len(results) == 120
+    assert func.call_count == 3
+    assert [c.kwargs["start"] for c in func.call_args_list] == [0, 100, 120]
+
+
+def test_scroll_wrapper_keeps_paging_when_server_caps_page_size():
+    func = MagicMock(side_effect=[list(range(25))] * 3)
+
+    results = scroll_wrapper(func)(number_of_items_to_fetch=60)
+
+    assert len(results) == 60
+    assert func.call_count == 3
+    assert [c.kwargs["start"] for c in func.call_args_list] == [0, 25, 50]
+
+
+def test_confluence_client_is_not_shared_across_processes(mocker):
+    pytest.importorskip("atlassian")
+    confluence = mocker.patch("atlassian.Confluence", side_effect=lambda **kwargs: MagicMock())
+    _get_cached_client.cache_clear()
+    getpid = mocker.patch("unstructured_ingest.utils.cache.os.getpid", return_value=1)
+    kwargs = {"url": "https://example.atlassian.net", "username": "user", "api_token": "token"}
+
+    parent_client = _get_cached_client(**kwargs)
+    assert _get_cached_client(**kwargs) is parent_client
+    getpid.return_value = 2
+    child_client = _get_cached_client(**kwargs)
+
+    assert child_client is not parent_client
+    assert confluence.call_count == 2
+    _get_cached_client.cache_clear()
@@ -0,0 +1,60 @@
+import datetime as dt
+from unittest.mock import MagicMock
+
+from unstructured_ingest.connector.discord import DiscordIngestDoc, DiscordSourceConnector
+from unstructured_ingest.interfaces import ProcessorConfig, ReadConfig
+
+
+def test_update_source_metadata_reuses_fetched_messages(mocker):
+    """Messages passed in by get_file should not trigger a second bot session."""
+    get_messages = mocker.patch(
+        "unstructured_ingest.connector.discord.DiscordIngestDoc._get_messages",
+    )
+    ingest_doc = DiscordIngestDoc(
+        connector_config=MagicMock(),
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+        channel="1234",
+    )
+    messages = [
+        MagicMock(created_at=dt.datetime(2023, 6, 16, 5, 5, 5)),
+        MagicMock(created_at=dt.datetime(2023, 6, 15, 5, 5, 5)),
+    ]
+
+    ingest_doc.update_source_metadata(messages_tuple=(messages, "https://discord.com/jump"))
+
+    get_messages.assert_not_called()
+    assert ingest_doc.source_metadata.date_created == "2023-06-15T05:05:05"
+    assert ingest_doc.source_metadata.date_modified == "2023-06-16T05:05:05"
+    assert ingest_doc.source_metadata.source_url == "https://discord.com/jump"
+
+
+def test_get_file_writes_one_message_per_line(mocker, tmp_path):
+    messages = [
+        MagicMock(content="first", created_at=dt.datetime(2023, 6, 15, 5, 5, 5)),
+        MagicMock(content="second", created_at=dt.datetime(2023, 6, 16, 5, 5, 5)),
+    ]
+    mocker.patch(
+        "unstructured_ingest.connector.discord.DiscordIngestDoc._get_messages",
+        return_value=(messages, None),
+    )
+    ingest_doc = DiscordIngestDoc(
+        connector_config=MagicMock(),
+        processor_config=ProcessorConfig(output_dir=str(tmp_path / "output")),
+        read_config=ReadConfig(download_dir=str(tmp_path / "download")),
+        channel="1234",
+    )
+
+    ingest_doc.get_file()
+
+    assert ingest_doc.filename.read_text() == "first\nsecond\n"
+
+
+def test_get_ingest_docs_dedupes_channels():
+    connector = DiscordSourceConnector(
+        connector_config=MagicMock(channels=["2", "1", "2", "3", "1"], period=None),
+        processor_config=ProcessorConfig(),
+        read_config=ReadConfig(),
+    )
+
+    assert [doc.channel for doc in connector.get_ingest_docs()] == ["2", "1", "3"]
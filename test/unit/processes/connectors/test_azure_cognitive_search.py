@@ -0,0 +1,144 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from unstructured_ingest.v2.interfaces import FileData, SourceIdentifiers
+from unstructured_ingest.v2.processes.connectors.azure_cognitive_search import (
+    AzureCognitiveSearchAccessConfig,
+    AzureCognitiveSearchConnectionConfig,
+    AzureCognitiveSearchUploader,
+    AzureCognitiveSearchUploaderConfig,
+    AzureCognitiveSearchUploadStager,
+    format_datetime,
+)
+
+
+@pytest.fixture
+def uploader(mocker):
+    client = MagicMock()
+    client.upload_documents.side_effect = lambda documents: [
+        MagicMock(succeeded=True) for _ in documents
+    ]
+    connection_config = AzureCognitiveSearchConnectionConfig(
+        endpoint="https://example.search.windows.net",
+        index="index",
+        access_config=AzureCognitiveSearchAccessConfig(key="key"),
+    )
+    mocker.patch.object(
+        AzureCognitiveSearchConnectionConfig, "generate_client", return_value=client
+    )
+    return AzureCognitiveSearchUploader(
+        upload_config=AzureCognitiveSearchUploaderConfig(batch_size=10, num_threads=3),
+        connection_config=connection_config,
+    )
+
+
+@pytest.fixture
+def file_data():
+    return FileData(
+        identifier="mock file data",
+        connector_type="mock",
+        source_identifiers=SourceIdentifiers(filename="elements.json", fullpath="elements.json"),
+    )
+
+
+def test_uploader_run_uploads_all_batches_with_one_client(uploader, file_data, tmp_path):
+    pytest.importorskip("azure.search.documents")
+    elements = [{"id": str(i), "text": f"element {i}"} for i in range(35)]
+    path = tmp_path / "elements.json"
+    path.write_text(json.dumps(elements))
+
+    uploader.run(path=path, file_data=file_data)
+
+    connection_config = uploader.connection_config
+    connection_config.generate_client.assert_called_once()
+    calls = uploader.client.upload_documents.call_args_list
+    assert sorted(len(c.kwargs["documents"]) for c in calls) == [5, 10, 10, 10]
+    uploaded_ids = {doc["id"] for c in calls for doc in c.kwargs["documents"]}
+    assert uploaded_ids == {e["id"] for e in elements}
+
+
+def test_uploader_run_splits_batches_by_bytes(uploader, file_data, tmp_path):
+    pytest.importorskip("azure.search.documents")
+    elements = [{"id": str(i), "text": "x" * 1000} for i in range(6)]
+    path = tmp_path / "elements.json"
+    path.write_text(json.dumps(elements))
+    uploader.upload_config.batch_size_bytes = 2500
+
+    uploader.run(path=path, file_data=file_data)
+
+    calls = uploader.client.upload_documents.call_args_list
+    assert [len(c.kwargs["documents"]) for c in calls] == [2, 2, 2]
+
+
+def test_uploader_run_skips_empty_batch_for_oversized_first_element(uploader, file_data, tmp_path):
+    pytest.importorskip("azure.search.documents")
+    elements = [{"id": "0", "text": "x" * 1000}, {"id": "1", "text": "x"}]
+    path = tmp_path / "elements.json"
+    path.write_text(json.dumps(elements))
+    uploader.upload_config.batch_size_bytes = 500
+
+    uploader.run(path=path, file_data=file_data)
+
+    calls = uploader.client.upload_documents.call_args_list
+    assert sorted(len(c.kwargs["documents"]) for c in calls) == [1, 1]
+
+
+def test_uploader_write_dict_splits_oversized_payload(uploader, mocker):
+    pytest.importorskip("azure.search.documents")
+    mocker.patch(
+        "unstructured_ingest.v2.processes.connectors.azure_cognitive_search.MAX_PAYLOAD_SIZE",
+        2500,
+    )
+    elements = [{"id": str(i), "text": "x" * 1000} for i in range(4)]
+
+    uploader.write_dict(elements_dict=elements)
+
+    calls = uploader.client.upload_documents.call_args_list
+    assert [c.kwargs["documents"] for c in calls] == [elements[:2], elements[2:]]
+
+
+def test_stager_conform_dict():
+    element = {
+        "text": "text",
+        "metadata": {
+            "coordinates": {"points": [[1.0, 2.0], [3.0, 4.0]]},
+            "links": [{"text": "link", "url": "https://example.com"}],
+            "last_modified": "2024-05-01T12:30:45+02:00",
+            "page_number": 3,
+            "data_source": {
+                "version": 1,
+                "record_locator": {"path": "/tmp/file"},
+                "date_created": "2024-05-01T12:30:45.123456",
+                "date_processed": 1714566645.5,
+            },
+        },
+    }
+
+    results = AzureCognitiveSearchUploadStager.conform_dict(data=element)
+
+    metadata = results["metadata"]
+    data_source = metadata["data_source"]
+    assert results["id"]
+    assert json.loads(metadata["coordinates"]["points"]) == [[1.0, 2.0], [3.0, 4.0]]
+    assert [json.loads(link) for link in metadata["links"]] == [
+        {"text": "link", "url": "https://example.com"}
+    ]
+    assert metadata["last_modified"] == "2024-05-01T12:30:45.000000Z"
+    assert metadata["page_number"] == "3"
+    assert data_source["version"] == "1"
+    assert json.loads(data_source["record_locator"]) == {"path": "/tmp/file"}
+    assert data_source["date_created"] == "2024-05-01T12:30:45.123456Z"
+    assert data_source["date_processed"].endswith(".500000Z")
+
+
+def test_stager_conform_dict_without_metadata():
+    results = AzureCognitiveSearchUploadStager.conform_dict(data={"text": "text"})
+
+    assert set(results.keys()) == {"id", "text"}
+
+
+def test_format_datetime_keeps_int_and_float_timestamps_apart():
+    assert format_datetime(1714566645000) == format_datetime(1714566645.0)
+    assert format_datetime(1714566645) != format_datetime(1714566645.0)
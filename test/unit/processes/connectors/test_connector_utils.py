@@ -0,0 +1,36 @@
+import pytest
+from dateutil import parser
+from dateutil.parser import ParserError
+
+from unstructured_ingest.v2.processes.connectors.utils import parse_datetime
+
+# Offsets are only valid after a time, dateutil rejects these
+INVALID_DATES = ("2024-05-01+05:00", "2024-05-01Z")
+
+
+@pytest.mark.parametrize(
+    "date_value",
+    [
+        "2024-05-01",
+        "2024-05-01T12:30:45",
+        "2024-05-01 12:30:45",
+        "2024-05-01T12:30:45.123",
+        "2024-05-01T12:30:45.123456",
+        "2024-05-01T12:30:45Z",
+        "2024-05-01T12:30:45.123456Z",
+        "2024-05-01T12:30:45+02:00",
+        "2024-05-01T12:30:45-0500",
+        "2024-05-01T12:30:45.1234567Z",
+        "May 1 2024 12:30:45",
+        *INVALID_DATES,
+    ],
+)
+def test_parse_datetime_matches_dateutil(date_value):
+    if date_value in INVALID_DATES:
+        with pytest.raises(ParserError):
+            parser.parse(date_value)
+        with pytest.raises(ParserError):
+            parse_datetime(date_value)
+        return
+    assert parse_datetime(date_value) == parser.parse(date_value)
+    assert parse_datetime(date_value).utcoffset() == parser.parse(date_value).utcoffset()
@@ -0,0 +1,87 @@
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from unstructured_ingest.v2.interfaces import FileData
+from unstructured_ingest.v2.processes.connectors.mongodb import (
+    MongoDBAccessConfig,
+    MongoDBConnectionConfig,
+    MongoDBIndexer,
+    MongoDBIndexerConfig,
+    MongoDBUploader,
+    MongoDBUploaderConfig,
+    MongoDBUploadStager,
+)
+
+
+@pytest.fixture
+def connection_config():
+    return MongoDBConnectionConfig(
+        access_config=MongoDBAccessConfig(uri="mongodb://localhost:27017"),
+        database="database",
+        collection="collection",
+    )
+
+
+def test_indexer_run_batches_streamed_ids(mocker, connection_config):
+    collection = MagicMock()
+    collection.find.return_value.batch_size.return_value = iter(
+        [{"_id": f"id-{i}"} for i in range(5)]
+    )
+    client = MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value = collection
+    mocker.patch.object(MongoDBConnectionConfig, "get_client", return_value=client)
+    indexer = MongoDBIndexer(
+        connection_config=connection_config,
+        index_config=MongoDBIndexerConfig(batch_size=2),
+    )
+
+    file_data = list(indexer.run())
+
+    collection.distinct.assert_not_called()
+    collection.find.assert_called_once_with({}, projection={"_id": 1})
+    assert [fd.additional_metadata["ids"] for fd in file_data] == [
+        ["id-0", "id-1"],
+        ["id-2", "id-3"],
+        ["id-4"],
+    ]
+
+
+def test_upload_stager_run_copies_elements(tmp_path):
+    elements = [{"text": "text", "metadata": {"filename": "file.txt"}}]
+    elements_filepath = tmp_path / "elements.json"
+    elements_filepath.write_text(json.dumps(elements))
+
+    output_path = MongoDBUploadStager().run(
+        elements_filepath=elements_filepath,
+        file_data=FileData(identifier="mock file data", connector_type="mock"),
+        output_dir=tmp_path,
+        output_filename="staged",
+    )
+
+    assert output_path == tmp_path / "staged.json"
+    assert json.loads(output_path.read_text()) == elements
+
+
+def test_uploader_run_inserts_all_batches(mocker, connection_config, tmp_path):
+    collection = MagicMock()
+    client = MagicMock()
+    client.__getitem__.return_value.__getitem__.return_value = collection
+    mocker.patch.object(MongoDBConnectionConfig, "get_client", return_value=client)
+    uploader = MongoDBUploader(
+        upload_config=MongoDBUploaderConfig(batch_size=10, num_threads=3),
+        connection_config=connection_config,
+    )
+    elements = [{"text": f"element {i}"} for i in range(25)]
+    path = tmp_path / "elements.json"
+    path.write_text(json.dumps(elements))
+
+    uploader.run(path=path, file_data=FileData(identifier="mock file data", connector_type="mock"))
+
+    calls = collection.insert_many.call_args_list
+    assert sorted(len(c.args[0]) for c in calls) == [5, 10, 10]
+    assert all(c.kwargs == {"ordered": False} for c in calls)
+    assert sorted(doc["text"] for c in calls for doc in c.args[0]) == sorted(
+        e["text"] for e in elements
+    )
@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock, PropertyMock
+
+import pytest
+from fsspec.asyn import get_loop
+
+from unstructured_ingest.v2.processes.connectors.fsspec.fsspec import FsspecIndexer
+from unstructured_ingest.v2.processes.connectors.fsspec.s3 import (
+    S3ConnectionConfig,
+    S3Indexer,
+    S3IndexerConfig,
+)
+
+
+@pytest.fixture
+def files():
+    return [
+        {"Key": f"bucket/file-{i}.txt", "size": 10, "type": "file", "ETag": f'"etag-{i}"'}
+        for i in range(3)
+    ]
+
+
+@pytest.fixture
+def fs(mocker, files):
+    fs = MagicMock(loop=get_loop())
+    mocker.patch.object(S3Indexer, "fs", new_callable=PropertyMock, return_value=fs)
+    mocker.patch.object(FsspecIndexer, "get_file_data", return_value=files)
+    mocker.patch("unstructured_ingest.v2.processes.connectors.fsspec.s3.METADATA_BATCH_SIZE", 2)
+    return fs
+
+
+@pytest.fixture
+def indexer():
+    return S3Indexer(
+        connection_config=S3ConnectionConfig(),
+        index_config=S3IndexerConfig(remote_url="s3://bucket"),
+    )
+
+
+def test_indexer_fetches_user_metadata_per_batch(fs, files, indexer):
+    pytest.importorskip("s3fs")
+
+    async def _metadata(path):
+        return {"path": path}
+
+    fs._metadata.side_effect = _metadata
+
+    file_data_iter = indexer.run()
+    first = next(file_data_iter)
+    assert fs._metadata.call_count == 2
+    file_data = [first, *file_data_iter]
+
+    fs.metadata.assert_not_called()
+    assert fs._metadata.call_count == 3
+    assert [fd.metadata.record_locator["metadata"] for fd in file_data] == [
+        {"path": f["Key"]} for f in files
+    ]
+    assert [fd.metadata.version for fd in file_data] == ["etag-0", "etag-1", "etag-2"]
+
+
+def test_indexer_user_metadata_suppresses_attribute_error(fs, indexer):
+    pytest.importorskip("s3fs")
+
+    async def _metadata(path):
+        if path.endswith("file-1.txt"):
+            raise AttributeError(path)
+        return {"path": path}
+
+    fs._metadata.side_effect = _metadata
+
+    file_data = list(indexer.run())
+
+    assert ["metadata" in fd.metadata.record_locator for fd in file_data] == [True, False, True]
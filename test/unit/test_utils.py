@@ -8,6 +8,9 @@ import pytz
 
 from unstructured_ingest.cli.utils import extract_config
 from unstructured_ingest.interfaces import BaseConfig
+from unstructured_ingest.utils import dep_check
+from unstructured_ingest.utils.cache import process_lru_cache
+from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.utils.string_and_date_utils import ensure_isoformat_datetime, json_to_dict
 
 
@@ -162,3 +165,45 @@ def test_ensure_isoformat_datetime_fails_on_string():
 def test_ensure_isoformat_datetime_fails_on_int():
     with pytest.raises(TypeError):
         ensure_isoformat_datetime(1111)
+
+
+def test_requires_dependencies_checks_once(mocker):
+    dependency_exists = mocker.spy(dep_check, "dependency_exists")
+
+    @requires_dependencies(["json"])
+    def func():
+        return "ran"
+
+    assert func() == "ran"
+    assert func() == "ran"
+    dependency_exists.assert_called_once_with("json")
+
+
+def test_requires_dependencies_missing_keeps_checking(mocker):
+    dependency_exists = mocker.patch.object(dep_check, "dependency_exists", return_value=False)
+
+    @requires_dependencies(["missing_dependency"], extras="missing")
+    def func():
+        return "ran"
+
+    for _ in range(2):
+        with pytest.raises(ImportError, match="unstructured-ingest\\[missing\\]"):
+            func()
+    assert dependency_exists.call_count == 2
+
+
+def test_process_lru_cache_is_not_shared_across_processes(mocker):
+    getpid = mocker.patch("unstructured_ingest.utils.cache.os.getpid", return_value=1)
+    calls = []
+
+    @process_lru_cache(maxsize=2)
+    def func(value):
+        calls.append(value)
+        return object()
+
+    parent_value = func("a")
+    assert func("a") is parent_value
+    getpid.return_value = 2
+
+    assert func("a") is not parent_value
+    assert calls == ["a", "a"]
@@ -1,5 +1,5 @@
-import math
 import typing as t
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -16,6 +16,7 @@ from unstructured_ingest.interfaces import (
     SourceMetadata,
 )
 from unstructured_ingest.logger import logger
+from unstructured_ingest.utils.cache import process_lru_cache
 from unstructured_ingest.utils.dep_check import requires_dependencies
 
 if t.TYPE_CHECKING:
@@ -57,6 +58,15 @@ class ConfluenceDocumentMeta:
     document_id: str
 
 
+@process_lru_cache(maxsize=8)
+@requires_dependencies(["atlassian"], extras="Confluence")
+def _get_cached_client(url: str, username: str, api_token: str) -> "Confluence":
+    # Shared per process so the client's HTTP session is reused across documents
+    from atlassian import Confluence
+
+    return Confluence(url=url, username=username, password=api_token)
+
+
 def scroll_wrapper(func):
     def wrapper(*args, **kwargs):
         """Wraps a function to obtain scroll functionality."""
@@ -67,16 +77,18 @@ def scroll_wrapper(func):
         kwargs["start"] = kwargs.get("start", 0)
 
         all_results = []
-        num_iterations = math.ceil(number_of_items_to_fetch / kwargs["limit"])
 
-        for _ in range(num_iterations):
+        while len(all_results) < number_of_items_to_fetch:
             response = func(*args, **kwargs)
-            if isinstance(response, list):
-                all_results += func(*args, **kwargs)
-            elif isinstance(response, dict):
-                all_results += func(*args, **kwargs)["results"]
+            if isinstance(response, dict):
+                response = response["results"]
+            # The server may cap pages below the requested limit, so only an empty page means
+            # there is nothing left to scroll through
+            if not response:
+                break
+            all_results += response
 
-            kwargs["start"] += kwargs["limit"]
+            kwargs["start"] += len(response)
 
         return all_results[:number_of_items_to_fetch]
 
@@ -88,8 +100,7 @@ class ConfluenceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     """Class encapsulating fetching a doc and writing processed results (but not
     doing the processing).
 
-    Current implementation creates a Confluence connection object
-    to fetch each doc, rather than creating a it for each thread.
+    The Confluence connection object is shared by all docs fetched within the same process.
     """
 
     connector_config: SimpleConfluenceConfig
@@ -123,14 +134,13 @@ class ConfluenceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     @SourceConnectionNetworkError.wrap
     @requires_dependencies(["atlassian"], extras="Confluence")
     def _get_page(self):
-        from atlassian import Confluence
         from atlassian.errors import ApiError
 
         try:
-            confluence = Confluence(
-                self.connector_config.url,
+            confluence = _get_cached_client(
+                url=self.connector_config.url,
                 username=self.connector_config.user_email,
-                password=self.connector_config.access_config.api_token,
+                api_token=self.connector_config.access_config.api_token,
             )
             result = confluence.get_page_by_id(
                 page_id=self.document_meta.document_id,
@@ -143,7 +153,7 @@ class ConfluenceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
 
     def update_source_metadata(self, **kwargs):
         """Fetches file metadata from the current page."""
-        page = kwargs.get("page", self._get_page())
+        page = kwargs["page"] if "page" in kwargs else self._get_page()
         if page is None:
             self.source_metadata = SourceMetadata(
                 exists=False,
@@ -174,17 +184,13 @@ class ConfluenceIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
     @requires_dependencies(["atlassian"], extras="confluence")
     @BaseSingleIngestDoc.skip_if_file_exists
     def get_file(self):
-        # TODO: instead of having a separate connection object for each doc,
-        # have a separate connection object for each process
-
         result = self._get_page()
         self.update_source_metadata(page=result)
         if result is None:
             raise ValueError(f"Failed to retrieve page with ID {self.document_meta.document_id}")
         self.document = result["body"]["view"]["value"]
         self.filename.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.filename, "w", encoding="utf8") as f:
-            f.write(self.document)
+        self.filename.write_bytes(self.document.encode("utf8"))
 
 
 @dataclass
@@ -192,19 +198,14 @@ class ConfluenceSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
     """Fetches body fields from all documents within all spaces in a Confluence Cloud instance."""
 
     connector_config: SimpleConfluenceConfig
-    _confluence: t.Optional["Confluence"] = field(init=False, default=None)
 
     @property
     def confluence(self) -> "Confluence":
-        from atlassian import Confluence
-
-        if self._confluence is None:
-            self._confluence = Confluence(
-                url=self.connector_config.url,
-                username=self.connector_config.user_email,
-                password=self.connector_config.access_config.api_token,
-            )
-        return self._confluence
+        return _get_cached_client(
+            url=self.connector_config.url,
+            username=self.connector_config.user_email,
+            api_token=self.connector_config.access_config.api_token,
+        )
 
     @requires_dependencies(["atlassian", "requests"], extras="Confluence")
     def check_connection(self):
@@ -262,7 +263,14 @@ class ConfluenceSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector
     def _get_doc_ids_within_spaces(self):
         space_ids = self._get_space_ids() if not self.list_of_spaces else self.list_of_spaces
 
-        doc_ids_all = [self._get_docs_ids_within_one_space(space_id=id) for id in space_ids]
+        # Listing pages is network bound, fan the per-space requests out over threads
+        with ThreadPoolExecutor(max_workers=self.processor_config.num_processes) as executor:
+            doc_ids_all = list(
+                executor.map(
+                    lambda space_id: self._get_docs_ids_within_one_space(space_id=space_id),
+                    space_ids,
+                )
+            )
 
         doc_ids_flattened = [
             (space_id, doc_id)
@@ -83,7 +83,7 @@ class DiscordIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
             try:
                 after_date = None
                 if self.days:
-                    after_date = dt.datetime.utcnow() - dt.timedelta(days=self.days)
+                    after_date = dt.datetime.now(dt.timezone.utc) - dt.timedelta(days=self.days)
                 channel = bot.get_channel(int(self.channel))
                 jumpurl.append(channel.jump_url)  # type: ignore
                 async for msg in channel.history(after=after_date):  # type: ignore
@@ -99,7 +99,10 @@ class DiscordIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
         return messages, jump_url
 
     def update_source_metadata(self, **kwargs):
-        messages, jump_url = kwargs.get("messages_tuple", self._get_messages())
+        if "messages_tuple" in kwargs:
+            messages, jump_url = kwargs["messages_tuple"]
+        else:
+            messages, jump_url = self._get_messages()
         if messages == []:
             self.source_metadata = SourceMetadata(
                 exists=False,
@@ -123,10 +126,8 @@ class DiscordIngestDoc(IngestDocCleanupMixin, BaseSingleIngestDoc):
         self.update_source_metadata(messages_tuple=(messages, jump_url))
         if messages == []:
             raise ValueError(f"Failed to retrieve messages from Discord channel {self.channel}")
-        self._tmp_download_file().parent.mkdir(parents=True, exist_ok=True)
         with open(self._tmp_download_file(), "w") as f:
-            for m in messages:
-                f.write(m.content + "\n")
+            f.writelines(m.content + "\n" for m in messages)
 
     @property
     def filename(self):
@@ -176,5 +177,6 @@ class DiscordSourceConnector(SourceConnectorCleanupMixin, BaseSourceConnector):
                 channel=channel,
                 days=self.connector_config.period,
             )
-            for channel in self.connector_config.channels
+            # A channel listed more than once would otherwise be downloaded once per listing
+            for channel in dict.fromkeys(self.connector_config.channels)
         ]
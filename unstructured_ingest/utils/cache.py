@@ -0,0 +1,24 @@
+import os
+from functools import lru_cache, wraps
+from typing import Callable, TypeVar
+
+_T = TypeVar("_T")
+
+
+def process_lru_cache(maxsize: int = 8) -> Callable[[Callable[..., _T]], Callable[..., _T]]:
+    """Like functools.lru_cache, but cached values are only reused by the process that created
+    them, so forked workers never share a parent's network clients and open connections."""
+
+    def decorator(func: Callable[..., _T]) -> Callable[..., _T]:
+        @lru_cache(maxsize=maxsize)
+        def cached(pid: int, *args, **kwargs) -> _T:
+            return func(*args, **kwargs)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs) -> _T:
+            return cached(os.getpid(), *args, **kwargs)
+
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+
+    return decorator
@@ -30,7 +30,12 @@ def generator_batching_wbytes(
 
     for item in iterable:
         item_size_bytes = len(json.dumps(item).encode("utf-8"))
-        if batch_size_limit_bytes and current_batch_size + item_size_bytes > batch_size_limit_bytes:
+        # An item larger than the limit on its own still goes out, in a batch by itself
+        if (
+            batch_size_limit_bytes
+            and current_batch
+            and current_batch_size + item_size_bytes > batch_size_limit_bytes
+        ):
             yield current_batch
             current_batch, current_batch_size = [item], item_size_bytes
             continue
@@ -36,7 +36,14 @@ def requires_dependencies(
         dependencies = [dependencies]
 
     def decorator(func: Callable[_P, _T]) -> Callable[_P, _T]:
+        # Once the dependencies are found they stay importable, so the check only needs to pass
+        # once rather than on every call of what is often a per-document hot path
+        dependencies_found = False
+
         def run_check():
+            nonlocal dependencies_found
+            if dependencies_found:
+                return
             missing_deps: List[str] = []
             for dep in dependencies:
                 if not dependency_exists(dep):
@@ -50,6 +57,7 @@ def requires_dependencies(
                         else f"Please install them using `pip install {' '.join(missing_deps)}`."
                     ),
                 )
+            dependencies_found = True
 
         @wraps(func)
         def wrapper(*args: _P.args, **kwargs: _P.kwargs):
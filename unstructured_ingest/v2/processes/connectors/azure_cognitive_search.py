@@ -1,13 +1,16 @@
-import json
 import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional, Union
 
+import orjson
 from pydantic import Field, Secret
 
 from unstructured_ingest.error import DestinationConnectionError, WriteError
-from unstructured_ingest.utils.data_prep import batch_generator
+from unstructured_ingest.utils.data_prep import generator_batching_wbytes
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.interfaces import (
     AccessConfig,
@@ -29,6 +32,16 @@ if TYPE_CHECKING:
 
 
 CONNECTOR_TYPE = "azure_cognitive_search"
+# Azure AI Search rejects any request over 16 MB, leave headroom for the request envelope
+MAX_PAYLOAD_SIZE = 15 * 1024 * 1024  # 15MB
+
+
+# Elements from the same file mostly share their dates, so only parse each distinct value once.
+# typed=True keeps int (epoch milliseconds) and float (epoch seconds) inputs apart.
+@lru_cache(maxsize=1024, typed=True)
+def format_datetime(date_value: Union[int, str, float, datetime]) -> str:
+    # Equivalent to strftime("%Y-%m-%dT%H:%M:%S.%fZ") but avoids the slower strftime call
+    return parse_datetime(date_value).replace(tzinfo=None).isoformat(timespec="microseconds") + "Z"
 
 
 class AzureCognitiveSearchAccessConfig(AccessConfig):
@@ -67,6 +80,16 @@ class AzureCognitiveSearchUploadStagerConfig(UploadStagerConfig):
 
 class AzureCognitiveSearchUploaderConfig(UploaderConfig):
     batch_size: int = Field(default=100, description="Number of records per batch")
+    batch_size_bytes: int = Field(
+        default=8_000_000,
+        description="Size limit (in bytes) for each batch of records to be uploaded. Azure AI "
+        "Search rejects requests larger than 16 MB, check "
+        "https://learn.microsoft.com/en-us/azure/search/search-limits-quotas-capacity"
+        " for more information.",
+    )
+    num_threads: int = Field(
+        default=4, description="Number of batches to upload concurrently while uploading content"
+    )
 
 
 @dataclass
@@ -83,43 +106,35 @@ class AzureCognitiveSearchUploadStager(UploadStager):
         Azure Cognitive Search index
         """
 
-        data["id"] = str(uuid.uuid4())
-
-        if points := data.get("metadata", {}).get("coordinates", {}).get("points"):
-            data["metadata"]["coordinates"]["points"] = json.dumps(points)
-        if version := data.get("metadata", {}).get("data_source", {}).get("version"):
-            data["metadata"]["data_source"]["version"] = str(version)
-        if record_locator := data.get("metadata", {}).get("data_source", {}).get("record_locator"):
-            data["metadata"]["data_source"]["record_locator"] = json.dumps(record_locator)
-        if permissions_data := (
-            data.get("metadata", {}).get("data_source", {}).get("permissions_data")
-        ):
-            data["metadata"]["data_source"]["permissions_data"] = json.dumps(permissions_data)
-        if links := data.get("metadata", {}).get("links"):
-            data["metadata"]["links"] = [json.dumps(link) for link in links]
-        if last_modified := data.get("metadata", {}).get("last_modified"):
-            data["metadata"]["last_modified"] = parse_datetime(last_modified).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ"
-            )
-        if date_created := data.get("metadata", {}).get("data_source", {}).get("date_created"):
-            data["metadata"]["data_source"]["date_created"] = parse_datetime(date_created).strftime(
-                "%Y-%m-%dT%H:%M:%S.%fZ"
-            )
-
-        if date_modified := data.get("metadata", {}).get("data_source", {}).get("date_modified"):
-            data["metadata"]["data_source"]["date_modified"] = parse_datetime(
-                date_modified
-            ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-
-        if date_processed := data.get("metadata", {}).get("data_source", {}).get("date_processed"):
-            data["metadata"]["data_source"]["date_processed"] = parse_datetime(
-                date_processed
-            ).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
-
-        if regex_metadata := data.get("metadata", {}).get("regex_metadata"):
-            data["metadata"]["regex_metadata"] = json.dumps(regex_metadata)
-        if page_number := data.get("metadata", {}).get("page_number"):
-            data["metadata"]["page_number"] = str(page_number)
+        data["id"] = uuid.uuid4().hex
+
+        # Look up the nested dicts once, these are the same objects held by data
+        metadata = data.get("metadata", {})
+        data_source = metadata.get("data_source", {})
+        coordinates = metadata.get("coordinates", {})
+
+        if points := coordinates.get("points"):
+            coordinates["points"] = orjson.dumps(points).decode()
+        if version := data_source.get("version"):
+            data_source["version"] = str(version)
+        if record_locator := data_source.get("record_locator"):
+            data_source["record_locator"] = orjson.dumps(record_locator).decode()
+        if permissions_data := data_source.get("permissions_data"):
+            data_source["permissions_data"] = orjson.dumps(permissions_data).decode()
+        if links := metadata.get("links"):
+            metadata["links"] = [orjson.dumps(link).decode() for link in links]
+        if last_modified := metadata.get("last_modified"):
+            metadata["last_modified"] = format_datetime(last_modified)
+        if date_created := data_source.get("date_created"):
+            data_source["date_created"] = format_datetime(date_created)
+        if date_modified := data_source.get("date_modified"):
+            data_source["date_modified"] = format_datetime(date_modified)
+        if date_processed := data_source.get("date_processed"):
+            data_source["date_processed"] = format_datetime(date_processed)
+        if regex_metadata := metadata.get("regex_metadata"):
+            metadata["regex_metadata"] = orjson.dumps(regex_metadata).decode()
+        if page_number := metadata.get("page_number"):
+            metadata["page_number"] = str(page_number)
         return data
 
     def run(
@@ -129,14 +144,12 @@ class AzureCognitiveSearchUploadStager(UploadStager):
         output_filename: str,
         **kwargs: Any,
     ) -> Path:
-        with open(elements_filepath) as elements_file:
-            elements_contents = json.load(elements_file)
+        elements_contents = orjson.loads(Path(elements_filepath).read_bytes())
 
         conformed_elements = [self.conform_dict(data=element) for element in elements_contents]
 
         output_path = Path(output_dir) / Path(f"{output_filename}.json")
-        with open(output_path, "w") as output_file:
-            json.dump(conformed_elements, output_file)
+        output_path.write_bytes(orjson.dumps(conformed_elements))
         return output_path
 
 
@@ -145,20 +158,33 @@ class AzureCognitiveSearchUploader(Uploader):
     upload_config: AzureCognitiveSearchUploaderConfig
     connection_config: AzureCognitiveSearchConnectionConfig
     connector_type: str = CONNECTOR_TYPE
+    _client: Optional["SearchClient"] = field(init=False, default=None)
+
+    @property
+    def client(self) -> "SearchClient":
+        # Share a single client (and its connection pool) across all batches
+        if self._client is None:
+            self._client = self.connection_config.generate_client()
+        return self._client
 
     @DestinationConnectionError.wrap
     @requires_dependencies(["azure"], extras="azure-cognitive-search")
     def write_dict(self, *args, elements_dict: list[dict[str, Any]], **kwargs) -> None:
         import azure.core.exceptions
 
+        if len(elements_dict) > 1 and len(orjson.dumps(elements_dict)) > MAX_PAYLOAD_SIZE:
+            # Split oversized batches up front rather than waiting for the service to reject them
+            mid = len(elements_dict) // 2
+            self.write_dict(elements_dict=elements_dict[:mid])
+            self.write_dict(elements_dict=elements_dict[mid:])
+            return
+
         logger.info(
             f"writing {len(elements_dict)} documents to destination "
             f"index at {self.connection_config.index}",
         )
         try:
-            results = self.connection_config.generate_client().upload_documents(
-                documents=elements_dict
-            )
+            results = self.client.upload_documents(documents=elements_dict)
 
         except azure.core.exceptions.HttpResponseError as http_error:
             raise WriteError(f"http error: {http_error}") from http_error
@@ -193,19 +219,31 @@ class AzureCognitiveSearchUploader(Uploader):
         return self.write_dict(elements_dict=elements_dict)
 
     def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
-        with path.open("r") as file:
-            elements_dict = json.load(file)
+        elements_dict = orjson.loads(path.read_bytes())
         logger.info(
             f"writing document batches to destination"
             f" endpoint at {str(self.connection_config.endpoint)}"
             f" index at {str(self.connection_config.index)}"
             f" with batch size {str(self.upload_config.batch_size)}"
+            f" and batch size (in bytes) {str(self.upload_config.batch_size_bytes)}"
+            f" across {str(self.upload_config.num_threads)} threads"
         )
 
-        batch_size = self.upload_config.batch_size
-
-        for chunk in batch_generator(elements_dict, batch_size):
-            self.write_dict(elements_dict=chunk)  # noqa: E203
+        chunks = list(
+            generator_batching_wbytes(
+                iterable=elements_dict,
+                batch_size_limit_bytes=self.upload_config.batch_size_bytes,
+                max_batch_size=self.upload_config.batch_size,
+            )
+        )
+        logger.info(f"split doc with {len(elements_dict)} elements into {len(chunks)} batches")
+
+        # SearchClient is thread safe, build it once up front so the threads share it
+        _ = self.client
+        with ThreadPoolExecutor(max_workers=self.upload_config.num_threads) as executor:
+            futures = [executor.submit(self.write_dict_wrapper, chunk) for chunk in chunks]
+            for future in as_completed(futures):
+                future.result()
 
 
 azure_cognitive_search_destination_entry = DestinationRegistryEntry(
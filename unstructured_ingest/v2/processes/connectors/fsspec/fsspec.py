@@ -156,27 +156,32 @@ class FsspecIndexer(Indexer):
     def sterilize_info(self, file_data: dict) -> dict:
         return sterilize_dict(data=file_data)
 
+    def build_file_data(self, file_data: dict, metadata: FileDataSourceMetadata) -> FileData:
+        file_path = self.get_path(file_data=file_data)
+        # Note: we remove any remaining leading slashes (Box introduces these)
+        # to get a valid relative path
+        rel_path = file_path.replace(self.index_config.path_without_protocol, "").lstrip("/")
+
+        additional_metadata = self.sterilize_info(file_data=file_data)
+        additional_metadata["original_file_path"] = file_path
+        return FileData(
+            identifier=str(uuid5(NAMESPACE_DNS, file_path)),
+            connector_type=self.connector_type,
+            source_identifiers=SourceIdentifiers(
+                filename=Path(file_path).name,
+                rel_path=rel_path or None,
+                fullpath=file_path,
+            ),
+            metadata=metadata,
+            additional_metadata=additional_metadata,
+            display_name=file_path,
+        )
+
     def run(self, **kwargs: Any) -> Generator[FileData, None, None]:
         files = self.get_file_data()
         for file_data in files:
-            file_path = self.get_path(file_data=file_data)
-            # Note: we remove any remaining leading slashes (Box introduces these)
-            # to get a valid relative path
-            rel_path = file_path.replace(self.index_config.path_without_protocol, "").lstrip("/")
-
-            additional_metadata = self.sterilize_info(file_data=file_data)
-            additional_metadata["original_file_path"] = file_path
-            yield FileData(
-                identifier=str(uuid5(NAMESPACE_DNS, file_path)),
-                connector_type=self.connector_type,
-                source_identifiers=SourceIdentifiers(
-                    filename=Path(file_path).name,
-                    rel_path=rel_path or None,
-                    fullpath=file_path,
-                ),
-                metadata=self.get_metadata(file_data=file_data),
-                additional_metadata=additional_metadata,
-                display_name=file_path,
+            yield self.build_file_data(
+                file_data=file_data, metadata=self.get_metadata(file_data=file_data)
             )
 
 
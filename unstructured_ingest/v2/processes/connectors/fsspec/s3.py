@@ -1,11 +1,13 @@
+import asyncio
 import contextlib
 from dataclasses import dataclass, field
 from pathlib import Path
 from time import time
-from typing import Any, Generator, Optional
+from typing import TYPE_CHECKING, Any, Generator, Optional
 
 from pydantic import Field, Secret
 
+from unstructured_ingest.utils.data_prep import batch_generator
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.interfaces import (
     DownloadResponse,
@@ -27,7 +29,12 @@ from unstructured_ingest.v2.processes.connectors.fsspec.fsspec import (
     FsspecUploaderConfig,
 )
 
+if TYPE_CHECKING:
+    from s3fs import S3FileSystem
+
 CONNECTOR_TYPE = "s3"
+# Maximum number of concurrent HEAD requests made while fetching object metadata
+METADATA_BATCH_SIZE = 500
 
 
 class S3IndexerConfig(FsspecIndexerConfig):
@@ -82,41 +89,70 @@ class S3Indexer(FsspecIndexer):
     def get_path(self, file_data: dict) -> str:
         return file_data["Key"]
 
-    def get_metadata(self, file_data: dict) -> FileDataSourceMetadata:
+    @staticmethod
+    async def _get_user_metadata(fs: "S3FileSystem", path: str) -> dict[str, str]:
+        with contextlib.suppress(AttributeError):
+            return await fs._metadata(path)
+        return {}
+
+    @classmethod
+    async def _gather_user_metadata(
+        cls, fs: "S3FileSystem", paths: list[str]
+    ) -> list[dict[str, str]]:
+        return await asyncio.gather(*[cls._get_user_metadata(fs=fs, path=path) for path in paths])
+
+    def get_metadata(
+        self, file_data: dict, user_metadata: Optional[dict[str, str]] = None
+    ) -> FileDataSourceMetadata:
+        # Everything except the user metadata comes from the listing itself, the metadata
+        # needs its own HEAD request since list responses don't include it
         path = file_data["Key"]
-        date_created = None
+        protocol = self.index_config.protocol
         date_modified = None
         modified = file_data.get("LastModified")
         if modified:
-            date_created = str(modified.timestamp())
             date_modified = str(modified.timestamp())
 
-        file_size = file_data.get("size") if "size" in file_data else None
-        file_size = file_size or file_data.get("Size")
+        file_size = file_data.get("size") or file_data.get("Size")
 
-        version = file_data.get("ETag").rstrip('"').lstrip('"') if "ETag" in file_data else None
-        metadata: dict[str, str] = {}
-        with contextlib.suppress(AttributeError):
-            metadata = self.fs.metadata(path=path)
+        etag = file_data.get("ETag")
+        version = etag.strip('"') if etag is not None else None
+        metadata = user_metadata
+        if metadata is None:
+            metadata = {}
+            with contextlib.suppress(AttributeError):
+                metadata = self.fs.metadata(path=path)
         record_locator = {
-            "protocol": self.index_config.protocol,
+            "protocol": protocol,
             "remote_file_path": self.index_config.remote_url,
         }
         if metadata:
             record_locator["metadata"] = metadata
         return FileDataSourceMetadata(
-            date_created=date_created,
+            date_created=date_modified,
             date_modified=date_modified,
             date_processed=str(time()),
             version=version,
-            url=f"{self.index_config.protocol}://{path}",
+            url=f"{protocol}://{path}",
             record_locator=record_locator,
             filesize_bytes=file_size,
         )
 
     @requires_dependencies(["s3fs", "fsspec"], extras="s3")
     def run(self, **kwargs: Any) -> Generator[FileData, None, None]:
-        return super().run(**kwargs)
+        from fsspec.asyn import sync
+
+        fs = self.fs
+        for batch in batch_generator(self.get_file_data(), batch_size=METADATA_BATCH_SIZE):
+            # Fetch the batch's user metadata concurrently on the filesystem's own event loop
+            # rather than making one HEAD request at a time
+            paths = [self.get_path(file_data=file_data) for file_data in batch]
+            all_user_metadata = sync(fs.loop, self._gather_user_metadata, fs=fs, paths=paths)
+            for file_data, user_metadata in zip(batch, all_user_metadata):
+                yield self.build_file_data(
+                    file_data=file_data,
+                    metadata=self.get_metadata(file_data=file_data, user_metadata=user_metadata),
+                )
 
     @requires_dependencies(["s3fs", "fsspec"], extras="s3")
     def precheck(self) -> None:
@@ -1,15 +1,19 @@
-import json
+import atexit
+import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from time import time
 from typing import TYPE_CHECKING, Any, Generator, Optional
 
+import orjson
 from pydantic import Field, Secret
 
 from unstructured_ingest.__version__ import __version__ as unstructured_version
 from unstructured_ingest.error import DestinationConnectionError, SourceConnectionError
+from unstructured_ingest.utils.cache import process_lru_cache
 from unstructured_ingest.utils.data_prep import batch_generator, flatten_dict
 from unstructured_ingest.utils.dep_check import requires_dependencies
 from unstructured_ingest.v2.interfaces import (
@@ -41,6 +45,30 @@ CONNECTOR_TYPE = "mongodb"
 SERVER_API_VERSION = "1"
 
 
+@process_lru_cache(maxsize=16)
+@requires_dependencies(["pymongo"], extras="mongodb")
+def _get_cached_client(uri: Optional[str], host: Optional[str], port: int) -> "MongoClient":
+    # pymongo clients are thread safe and pool their connections, so one is shared per process
+    from pymongo import MongoClient
+    from pymongo.driver_info import DriverInfo
+    from pymongo.server_api import ServerApi
+
+    if uri:
+        client = MongoClient(
+            uri,
+            server_api=ServerApi(version=SERVER_API_VERSION),
+            driver=DriverInfo(name="unstructured", version=unstructured_version),
+        )
+    else:
+        client = MongoClient(
+            host=host,
+            port=port,
+            server_api=ServerApi(version=SERVER_API_VERSION),
+        )
+    atexit.register(client.close)
+    return client
+
+
 class MongoDBAccessConfig(AccessConfig):
     uri: Optional[str] = Field(default=None, description="URI to user when connecting")
 
@@ -59,6 +87,10 @@ class MongoDBConnectionConfig(ConnectionConfig):
     port: int = Field(default=27017)
     connector_type: str = Field(default=CONNECTOR_TYPE, init=False)
 
+    def get_client(self) -> "MongoClient":
+        access_config = self.access_config.get_secret_value()
+        return _get_cached_client(uri=access_config.uri, host=self.host, port=self.port)
+
 
 class MongoDBUploadStagerConfig(UploadStagerConfig):
     pass
@@ -81,42 +113,23 @@ class MongoDBIndexer(Indexer):
     def precheck(self) -> None:
         """Validates the connection to the MongoDB server."""
         try:
-            client = self.create_client()
+            client = self.connection_config.get_client()
             client.admin.command("ping")
         except Exception as e:
             logger.error(f"Failed to validate connection: {e}", exc_info=True)
             raise SourceConnectionError(f"Failed to validate connection: {e}")
 
-    @requires_dependencies(["pymongo"], extras="mongodb")
-    def create_client(self) -> "MongoClient":
-        from pymongo import MongoClient
-        from pymongo.driver_info import DriverInfo
-        from pymongo.server_api import ServerApi
-
-        access_config = self.connection_config.access_config.get_secret_value()
-
-        if access_config.uri:
-            return MongoClient(
-                access_config.uri,
-                server_api=ServerApi(version=SERVER_API_VERSION),
-                driver=DriverInfo(name="unstructured", version=unstructured_version),
-            )
-        else:
-            return MongoClient(
-                host=self.connection_config.host,
-                port=self.connection_config.port,
-                server_api=ServerApi(version=SERVER_API_VERSION),
-            )
-
     def run(self, **kwargs: Any) -> Generator[FileData, None, None]:
         """Generates FileData objects for each document in the MongoDB collection."""
-        client = self.create_client()
+        client = self.connection_config.get_client()
         database = client[self.connection_config.database]
         collection = database[self.connection_config.collection]
 
-        # Get list of document IDs
-        ids = collection.distinct("_id")
         batch_size = self.index_config.batch_size if self.index_config else 100
+        # Stream the document IDs with a cursor rather than loading them all with distinct(),
+        # which holds every ID in memory and fails once the result exceeds 16MB
+        cursor = collection.find({}, projection={"_id": 1}).batch_size(batch_size)
+        ids = (doc["_id"] for doc in cursor)
 
         for id_batch in batch_generator(ids, batch_size=batch_size):
             # Make sure the hash is always a positive number to create identifier
@@ -148,27 +161,6 @@ class MongoDBDownloader(Downloader):
     connection_config: MongoDBConnectionConfig
     connector_type: str = CONNECTOR_TYPE
 
-    @requires_dependencies(["pymongo"], extras="mongodb")
-    def create_client(self) -> "MongoClient":
-        from pymongo import MongoClient
-        from pymongo.driver_info import DriverInfo
-        from pymongo.server_api import ServerApi
-
-        access_config = self.connection_config.access_config.get_secret_value()
-
-        if access_config.uri:
-            return MongoClient(
-                access_config.uri,
-                server_api=ServerApi(version=SERVER_API_VERSION),
-                driver=DriverInfo(name="unstructured", version=unstructured_version),
-            )
-        else:
-            return MongoClient(
-                host=self.connection_config.host,
-                port=self.connection_config.port,
-                server_api=ServerApi(version=SERVER_API_VERSION),
-            )
-
     @SourceConnectionError.wrap
     @requires_dependencies(["bson"], extras="mongodb")
     def run(self, file_data: FileData, **kwargs: Any) -> download_responses:
@@ -176,7 +168,7 @@ class MongoDBDownloader(Downloader):
         from bson.errors import InvalidId
         from bson.objectid import ObjectId
 
-        client = self.create_client()
+        client = self.connection_config.get_client()
         database = client[self.connection_config.database]
         collection = database[self.connection_config.collection]
 
@@ -200,6 +192,8 @@ class MongoDBDownloader(Downloader):
             raise e
 
         download_responses = []
+        # Documents in a batch usually share a download directory, only create each one once
+        created_dirs: set[Path] = set()
         for doc in docs:
             doc_id = doc["_id"]
             doc.pop("_id", None)
@@ -218,9 +212,6 @@ class MongoDBDownloader(Downloader):
                 # Use the ObjectId's generation time
                 date_created = doc_id.generation_time.isoformat()
 
-            flattened_dict = flatten_dict(dictionary=doc)
-            concatenated_values = "\n".join(str(value) for value in flattened_dict.values())
-
             # Create a FileData object for each document with source_identifiers
             individual_file_data = FileData(
                 identifier=str(doc_id),
@@ -237,12 +228,18 @@ class MongoDBDownloader(Downloader):
             if download_path is None:
                 raise ValueError("Download path could not be determined")
 
-            download_path.parent.mkdir(parents=True, exist_ok=True)
+            if download_path.parent not in created_dirs:
+                download_path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(download_path.parent)
             download_path = download_path.with_suffix(".txt")
 
-            # Write the concatenated values to the file
+            # Write the flattened values one per line, streaming them to the file rather than
+            # joining them into a second copy of the whole document first
             with open(download_path, "w", encoding="utf8") as f:
-                f.write(concatenated_values)
+                for i, value in enumerate(flatten_dict(dictionary=doc).values()):
+                    if i:
+                        f.write("\n")
+                    f.write(str(value))
 
             individual_file_data.local_download_path = str(download_path)
 
@@ -279,17 +276,17 @@ class MongoDBUploadStager(UploadStager):
         output_filename: str,
         **kwargs: Any,
     ) -> Path:
-        with open(elements_filepath) as elements_file:
-            elements_contents = json.load(elements_file)
-
+        # Elements are uploaded as-is, so there is nothing to parse or rewrite
         output_path = Path(output_dir) / Path(f"{output_filename}.json")
-        with open(output_path, "w") as output_file:
-            json.dump(elements_contents, output_file)
+        shutil.copyfile(elements_filepath, output_path)
         return output_path
 
 
 class MongoDBUploaderConfig(UploaderConfig):
     batch_size: int = Field(default=100, description="Number of records per batch")
+    num_threads: int = Field(
+        default=4, description="Number of batches to insert concurrently while uploading content"
+    )
 
 
 @dataclass
@@ -300,47 +297,32 @@ class MongoDBUploader(Uploader):
 
     def precheck(self) -> None:
         try:
-            client = self.create_client()
+            client = self.connection_config.get_client()
             client.admin.command("ping")
         except Exception as e:
             logger.error(f"failed to validate connection: {e}", exc_info=True)
             raise DestinationConnectionError(f"failed to validate connection: {e}")
 
-    @requires_dependencies(["pymongo"], extras="mongodb")
-    def create_client(self) -> "MongoClient":
-        from pymongo import MongoClient
-        from pymongo.driver_info import DriverInfo
-        from pymongo.server_api import ServerApi
-
-        access_config = self.connection_config.access_config.get_secret_value()
-
-        if access_config.uri:
-            return MongoClient(
-                access_config.uri,
-                server_api=ServerApi(version=SERVER_API_VERSION),
-                driver=DriverInfo(name="unstructured", version=unstructured_version),
-            )
-        else:
-            return MongoClient(
-                host=self.connection_config.host,
-                port=self.connection_config.port,
-                server_api=ServerApi(version=SERVER_API_VERSION),
-            )
-
     def run(self, path: Path, file_data: FileData, **kwargs: Any) -> None:
-        with path.open("r") as file:
-            elements_dict = json.load(file)
+        elements_dict = orjson.loads(path.read_bytes())
         logger.info(
             f"writing {len(elements_dict)} objects to destination "
             f"db, {self.connection_config.database}, "
             f"collection {self.connection_config.collection} "
             f"at {self.connection_config.host}",
         )
-        client = self.create_client()
+        client = self.connection_config.get_client()
         db = client[self.connection_config.database]
         collection = db[self.connection_config.collection]
-        for chunk in batch_generator(elements_dict, self.upload_config.batch_size):
-            collection.insert_many(chunk)
+        # pymongo clients are thread safe and pool their connections, so batches can be inserted
+        # concurrently. Unordered inserts keep going past a failing document in a batch.
+        with ThreadPoolExecutor(max_workers=self.upload_config.num_threads) as executor:
+            futures = [
+                executor.submit(collection.insert_many, chunk, ordered=False)
+                for chunk in batch_generator(elements_dict, self.upload_config.batch_size)
+            ]
+            for future in as_completed(futures):
+                future.result()
 
 
 mongodb_destination_entry = DestinationRegistryEntry(
@@ -1,10 +1,15 @@
 import json
+import re
 from datetime import datetime
 from typing import Any, Union
 
 from dateutil import parser
 from pydantic import ValidationError
 
+ISO_8601_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+)
+
 
 def parse_datetime(date_value: Union[int, str, float, datetime]) -> datetime:
     if isinstance(date_value, datetime):
@@ -14,6 +19,14 @@ def parse_datetime(date_value: Union[int, str, float, datetime]) -> datetime:
     elif isinstance(date_value, int):
         return datetime.fromtimestamp(date_value / 1000)
 
+    # Most dates are already ISO 8601, which datetime can parse far faster than dateutil
+    if ISO_8601_PATTERN.fullmatch(date_value):
+        try:
+            return datetime.fromisoformat(date_value.replace("Z", "+00:00"))
+        except ValueError:
+            # Not every ISO 8601 variant is supported by fromisoformat on older Pythons
+            pass
+
     try:
         timestamp = float(date_value)
         return datetime.fromtimestamp(timestamp)